@@ -0,0 +1,153 @@
+"""
+Asynchronous PayU client. Requires ``httpx`` (``django-getpaid[async]``).
+"""
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from getpaid.exceptions import CommunicationError
+
+from .client import BaseClient, ensure_auth
+from .types import RetrieveOrderInfoResponse
+
+
+class AsyncClient(BaseClient):
+    """
+    Asynchronous counterpart of :class:`~getpaid.backends.payu.client.Client`
+    for read-only endpoints. All calls share one HTTP/2 connection, so
+    independent requests can be awaited concurrently::
+
+        async with AsyncClient() as client:
+            status, balance = await asyncio.gather(
+                client.submerchant_status(ext_customer_id),
+                client.submerchant_balance(ext_customer_id),
+            )
+
+    The token cached by other clients is read from Django cache once, when
+    the client is created; create it outside of latency-sensitive code.
+    """
+
+    __slots__ = ("_http", "_auth_lock")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._http = self._create_http_client()
+        # created on first use, so it binds to the loop running the calls
+        self._auth_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(http2=True)
+
+    async def _authorize(self, rejected_token: str = None):
+        """
+        Obtain a new token unless a valid one is already there. Concurrent
+        callers wait for the first of them instead of authorizing again.
+        Django cache is accessed in the default executor, so network cache
+        backends don't block the event loop.
+
+        :param rejected_token: Token PayU answered 401 to, to be replaced
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        loop = asyncio.get_event_loop()
+        async with self._auth_lock:
+            if rejected_token is not None and self.token == rejected_token:
+                await loop.run_in_executor(None, self._forget_token)
+            elif not self._token_expired():
+                return
+            response = await self._http.post(self._auth_url, data=self._get_auth_data())
+            await loop.run_in_executor(None, self._store_token, response)
+
+    async def _get(
+        self, url: str, params: dict = None, headers: dict = None
+    ) -> httpx.Response:
+        """
+        Send GET request and, if PayU rejects the token, drop it from cache,
+        authorize again and repeat the request once.
+        """
+        headers = headers or {}
+        token = self.token
+        response = await self._http.get(
+            url, params=params, headers={**headers, "Authorization": token}
+        )
+        if response.status_code == 401:
+            await self._authorize(rejected_token=token)
+            response = await self._http.get(
+                url, params=params, headers={**headers, "Authorization": self.token}
+            )
+        return response
+
+    @ensure_auth
+    async def submerchant_status(self, ext_customer_id, currency_code="PLN"):
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/status"
+        response = await self._get(url, params={"currencyCode": currency_code})
+        return self._parse(response)
+
+    @ensure_auth
+    async def submerchant_balance(self, ext_customer_id, currency_code="PLN"):
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/balances"
+        response = await self._get(url, params={"currencyCode": currency_code})
+        return self._parse(response)
+
+    @ensure_auth
+    async def submerchant_operations(
+        self,
+        ext_customer_id: str,
+        date_from: datetime,
+        date_to: datetime,
+        currency_code: str = "PLN",
+        limit: int = None,
+        page: int = None,
+        order_by: str = None,
+        type: str = None,
+    ):
+        """
+        See :meth:`Client.submerchant_operations`.
+        """
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/operations"
+        params = {
+            "currencyCode": currency_code,
+            "eventDateFrom": date_from.replace(microsecond=0).isoformat(),
+            "eventDateTo": date_to.replace(microsecond=0).isoformat(),
+            "offset": page,
+            "type": type,
+            "limit": limit,
+            "sortBy": order_by,
+        }
+        response = await self._get(
+            url, params={k: v for k, v in params.items() if v is not None}
+        )
+        return self._parse(response)
+
+    @ensure_auth
+    async def get_order_info(
+        self, order_id: str, **kwargs
+    ) -> RetrieveOrderInfoResponse:
+        url = f"{self._api_v21}/orders/{order_id}"
+        response = await self._get(url, headers=kwargs)
+        return self._handle(response, (200,), CommunicationError)
+
+    @ensure_auth
+    async def get_shop_info(self, shop_id: str, **kwargs):
+        """
+        Get own shop info
+
+        :param shop_id: Public shop_id
+        :param kwargs:
+        :return:
+        """
+        response = await self._get(f"{self._api_v21}/shops/{shop_id}", headers=kwargs)
+        return self._handle(
+            response, (200,), CommunicationError, "Error getting shop info"
+        )
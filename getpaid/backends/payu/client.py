@@ -1,14 +1,23 @@
+import asyncio
 import datetime
-import json
-from copy import deepcopy
+import hashlib
+import inspect
+import sys
+import threading
+import time
 from decimal import Decimal
-from functools import wraps
-from typing import Callable, List, Optional, Union
-from urllib.parse import urlencode, urljoin
+from functools import lru_cache, wraps
+from typing import Callable, List, Optional, Type, Union
 
-import pendulum
+import orjson
 import requests
-from django.core.serializers.json import DjangoJSONEncoder
+from cachetools import TTLCache
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import Promise
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from getpaid.exceptions import (
     ChargeFailure,
@@ -24,38 +33,199 @@ from getpaid.types import ItemInfo, ShoppingCart
 from .types import (
     BuyerData,
     CancellationResponse,
+    ChargeRequest,
     ChargeResponse,
     Currency,
+    OrderData,
     OrderStatus,
     PaymentResponse,
+    PayoutRequest,
     ProductData,
+    RefundInfo,
     RefundResponse,
     RetrieveOrderInfoResponse,
+    ShoppingCartData,
 )
 
 
+_read_cache = TTLCache(maxsize=512, ttl=5)
+_read_cache_lock = threading.Lock()
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _to_cents(amount: Union[Decimal, float, int]) -> int:
+    if isinstance(amount, Decimal):
+        return int((amount * 100).to_integral_value())
+    return int(amount * 100)
+
+
+def _json_default(obj):
+    if isinstance(obj, (Decimal, Promise)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=1)
+def _get_default_client_params() -> dict:
+    """
+    Client params read from settings once per process; refreshed only when
+    the settings get overridden (e.g. in tests).
+    """
+    from . import PaymentProcessor
+
+    processor = PaymentProcessor
+    return {
+        "api_url": processor.get_paywall_baseurl(),
+        "pos_id": processor.get_setting("pos_id"),
+        "second_key": processor.get_setting("second_key"),
+        "oauth_id": processor.get_setting("oauth_id"),
+        "oauth_secret": processor.get_setting("oauth_secret"),
+        "is_marketplace": processor.get_setting("is_marketplace"),
+    }
+
+
+@receiver(setting_changed)
+def _clear_default_client_params(*, setting, **kwargs):
+    if setting in ("GETPAID_BACKEND_SETTINGS", "GETPAID"):
+        _get_default_client_params.cache_clear()
+
+
+def _token_cache_key(oauth_id) -> str:
+    digest = hashlib.sha256(str(oauth_id).encode()).hexdigest()
+    return f"payu:token:{digest}"
+
+
+def _get_cached_token(oauth_id) -> Optional[tuple]:
+    """
+    Return ``(token, expiration_timestamp)`` shared by all clients using given
+    OAuth credentials or None if it has to be obtained again.
+    """
+    return cache.get(_token_cache_key(oauth_id))
+
+
+def _create_session() -> requests.Session:
+    """
+    Session keeping connections to PayU alive. Failed gateway responses are
+    retried for idempotent methods.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries),
+    )
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def _get_session(api_url: str) -> requests.Session:
+    """
+    Return the session shared by all clients of given PayU instance, so its
+    connection pool outlives single payments. It carries no credentials.
+    """
+    with _sessions_lock:
+        session = _sessions.get(api_url)
+        if session is None:
+            session = _sessions[api_url] = _create_session()
+    return session
+
+
 def ensure_auth(func: Callable) -> Callable:
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _af(self, *args, **kwargs):
+            if self._token_expired():
+                await self._authorize()
+            return await func(self, *args, **kwargs)
+
+        return _af
+
     @wraps(func)
     def _f(self, *args, **kwargs):
-        if self.token_expiration < pendulum.now().add(seconds=-5):
+        if self._token_expired():
             self._authorize()
         return func(self, *args, **kwargs)
 
     return _f
 
 
-class Client:
-    last_response = None
-    _convertables = {
-        "amount",
-        "total",
-        "available",
-        "unitPrice",
-        "totalAmount",
-        "fee",
-        "availableAmount",
-        "totalAmount",
-    }
+def cached_read(func: Callable) -> Callable:
+    """
+    Keep results of idempotent GETs for a few seconds, so bursts of identical
+    calls (e.g. dashboard refreshes) reach PayU once. Pass ``no_cache=True``
+    to bypass.
+
+    Decorated method returns ``(response, data)`` and its callers get
+    ``data``. Only bodies of 2xx responses are kept, as bytes; every cache hit
+    parses them again, so callers never share returned data.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def _f(self, *args, no_cache=False, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = [func.__name__, self.api_url, self.oauth_id]
+        for name, value in list(bound.arguments.items())[1:]:
+            if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+                value = tuple(sorted(value.items()))
+            key.append(value)
+        key = tuple(key)
+        if not no_cache:
+            with _read_cache_lock:
+                content = _read_cache.get(key)
+            if content is not None:
+                return self._normalize(orjson.loads(content))
+        response, result = func(self, *args, **kwargs)
+        if 200 <= response.status_code < 300:
+            with _read_cache_lock:
+                _read_cache[key] = response.content
+        return result
+
+    return _f
+
+
+class BaseClient:
+    """
+    Connection params, OAuth token bookkeeping, amount conversion and response
+    handling shared by :class:`Client` and
+    :class:`~getpaid.backends.payu.async_client.AsyncClient`.
+    """
+
+    __slots__ = (
+        "api_url",
+        "pos_id",
+        "second_key",
+        "oauth_id",
+        "oauth_secret",
+        "is_marketplace",
+        "token",
+        "token_expiration",
+        "last_response",
+        "_api_v21",
+        "_auth_url",
+    )
+    _convertables = frozenset(
+        map(
+            sys.intern,
+            (
+                "amount",
+                "total",
+                "available",
+                "unitPrice",
+                "totalAmount",
+                "fee",
+                "availableAmount",
+            ),
+        )
+    )
 
     def __init__(
         self,
@@ -66,6 +236,7 @@ class Client:
         oauth_secret: str = None,
         is_marketplace: bool = None,
     ):
+        self.last_response = None
         default_params = self._get_client_params()
         self.api_url = api_url or default_params["api_url"]
         self.pos_id = pos_id or default_params["pos_id"]
@@ -73,44 +244,106 @@ class Client:
         self.oauth_id = oauth_id or default_params["oauth_id"]
         self.oauth_secret = oauth_secret or default_params["oauth_secret"]
         self.is_marketplace = is_marketplace or default_params["is_marketplace"]
-        self._authorize()
+        base_url = self.api_url.rstrip("/")
+        self._api_v21 = f"{base_url}/api/v2_1"
+        self._auth_url = f"{base_url}/pl/standard/user/oauth/authorize"
+        self.token = None
+        self.token_expiration = 0
+        cached_token = _get_cached_token(self.oauth_id)
+        if cached_token:
+            self.token, expires_at = cached_token
+            self.token_expiration = time.monotonic() + expires_at - time.time() - 5
 
     def _get_client_params(self) -> dict:
-        from . import PaymentProcessor
+        return _get_default_client_params()
 
-        processor = PaymentProcessor
+    def _get_auth_data(self) -> dict:
         return {
-            "api_url": processor.get_paywall_baseurl(),
-            "pos_id": processor.get_setting("pos_id"),
-            "second_key": processor.get_setting("second_key"),
-            "oauth_id": processor.get_setting("oauth_id"),
-            "oauth_secret": processor.get_setting("oauth_secret"),
-            "is_marketplace": processor.get_setting("is_marketplace"),
+            "grant_type": "client_credentials",
+            "client_id": self.oauth_id,
+            "client_secret": self.oauth_secret,
         }
 
-    def _authorize(self):
-        url = urljoin(self.api_url, "/pl/standard/user/oauth/authorize")
-        self.last_response = requests.post(
-            url,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.oauth_id,
-                "client_secret": self.oauth_secret,
-            },
-        )
-        if self.last_response.status_code == 200:
-            data = self.last_response.json()
-            self.token = f"{data['token_type'].capitalize()} {data['access_token']}"
-            self.token_expiration = pendulum.now().add(seconds=int(data["expires_in"]))
-        else:
+    def _token_expired(self) -> bool:
+        return time.monotonic() >= self.token_expiration
+
+    def _store_token(self, response):
+        """
+        Keep the token from OAuth response and share it with other clients
+        using the same credentials, or raise :class:`CredentialsError`.
+        """
+        if response.status_code != 200:
+            self.last_response = response
             raise CredentialsError(
-                "Cannot authenticate.", context={"raw_response": self.last_response}
+                "Cannot authenticate.", context={"raw_response": response}
             )
+        data = orjson.loads(response.content)
+        self.token = f"{data['token_type'].capitalize()} {data['access_token']}"
+        expires_in = int(data["expires_in"])
+        self.token_expiration = time.monotonic() + expires_in - 5
+        cache.set(
+            _token_cache_key(self.oauth_id),
+            (self.token, time.time() + expires_in),
+            timeout=max(expires_in - 60, 0),
+        )
 
-    def _headers(self, **kwargs):
-        data = {"Authorization": self.token, "Content-Type": "application/json"}
-        data.update(kwargs)
-        return data
+    def _forget_token(self):
+        cache.delete(_token_cache_key(self.oauth_id))
+
+    def _parse(self, response):
+        """
+        Return normalized body of a response whatever its status. Used by
+        submerchant reads, which pass PayU's error bodies to the caller.
+        """
+        return self._normalize(orjson.loads(response.content))
+
+    def _handle(
+        self,
+        response,
+        ok_codes: tuple,
+        exc_class: Type[GetPaidException],
+        *args,
+        with_response: bool = False,
+    ):
+        """
+        Return normalized body of a successful (requests or httpx) response,
+        preceded by the response itself if ``with_response`` is set, otherwise
+        raise ``exc_class(*args)`` keeping the response in its context.
+        """
+        if response.status_code in ok_codes:
+            data = self._parse(response)
+            return (response, data) if with_response else data
+        self.last_response = response
+        raise exc_class(*args, context={"raw_response": response})
+
+    @staticmethod
+    def _walk(data: Union[ItemInfo, dict, list, Decimal, int, float, str], leaf_fn):
+        """
+        Rebuild given object without recursion, passing every leaf value
+        through ``leaf_fn(key, value)``. Input is never modified.
+        :param data: Converted data
+        :param leaf_fn: Callable returning converted leaf value
+        """
+        if hasattr(data, "items"):
+            result = {}
+        elif isinstance(data, list):
+            result = [None] * len(data)
+        else:
+            return leaf_fn(None, data)
+        stack = [(result, data)]
+        while stack:
+            target, source = stack.pop()
+            items = source.items() if hasattr(source, "items") else enumerate(source)
+            for key, value in items:
+                if hasattr(value, "items"):
+                    target[key] = {}
+                    stack.append((target[key], value))
+                elif isinstance(value, list):
+                    target[key] = [None] * len(value)
+                    stack.append((target[key], value))
+                else:
+                    target[key] = leaf_fn(key, value)
+        return result
 
     @classmethod
     def _centify(cls, data: Union[ItemInfo, dict, list, Decimal, int, float, str]):
@@ -118,16 +351,10 @@ class Client:
         Traverse through given object and convert all values of 'amount'
         fields and all keys to PayU format.
         :param data: Converted data
+        :return: New structure, ``data`` is left untouched
         """
-        data = deepcopy(data)
-        if hasattr(data, "items"):
-            return {
-                k: int(v * 100) if k in cls._convertables else cls._centify(v)
-                for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [cls._centify(v) for v in data]
-        return data
+        convertables = cls._convertables
+        return cls._walk(data, lambda k, v: _to_cents(v) if k in convertables else v)
 
     @classmethod
     def _normalize(cls, data: Union[ItemInfo, dict, list, Decimal, int, float, str]):
@@ -135,16 +362,68 @@ class Client:
         Traverse through given object and convert all values of 'amount'
         fields to normal and all PayU-specific keys to standard ones.
         :param data: Converted data
+        :return: New structure, ``data`` is left untouched
         """
-        data = deepcopy(data)
-        if hasattr(data, "items"):
-            return {
-                k: Decimal(v) / 100 if k in cls._convertables else cls._normalize(v)
-                for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [cls._normalize(v) for v in data]
-        return data
+        convertables = cls._convertables
+        return cls._walk(
+            data, lambda k, v: Decimal(v).scaleb(-2) if k in convertables else v
+        )
+
+
+class Client(BaseClient):
+    __slots__ = ("_session",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session = _get_session(self.api_url.rstrip("/"))
+        if not self.token:
+            self._authorize()
+
+    def _authorize(self):
+        response = self._session.post(
+            self._auth_url,
+            data=self._get_auth_data(),
+            headers={"Content-Type": None},
+        )
+        self._store_token(response)
+
+    def _retry_on_401(
+        self, send: Callable, url: str, headers: dict = None, **kwargs
+    ) -> requests.Response:
+        """
+        Send the request with client's token and, if PayU rejects it, drop it
+        from cache, authorize again and repeat the request once.
+        """
+        headers = headers or {}
+        response = send(url, headers={**headers, "Authorization": self.token}, **kwargs)
+        if response.status_code == 401:
+            self._forget_token()
+            self._authorize()
+            response = send(
+                url, headers={**headers, "Authorization": self.token}, **kwargs
+            )
+        return response
+
+    @staticmethod
+    def _centify_products(products: List[ProductData]) -> List[ProductData]:
+        return [{**p, "unitPrice": _to_cents(p["unitPrice"])} for p in products]
+
+    @classmethod
+    def _centify_shopping_carts(
+        cls, shopping_carts: List[ShoppingCart]
+    ) -> List[ShoppingCartData]:
+        """
+        Copy marketplace carts converting their amounts to PayU format.
+        :param shopping_carts: Carts as given to :meth:`new_order`
+        """
+        carts = []
+        for cart in shopping_carts:
+            cart = {**cart, "products": cls._centify_products(cart["products"])}
+            for key in ("amount", "fee"):
+                if key in cart:
+                    cart[key] = _to_cents(cart[key])
+            carts.append(cart)
+        return carts
 
     @ensure_auth
     def new_order(
@@ -152,13 +431,14 @@ class Client:
         amount: Union[Decimal, float],
         currency: Currency,
         order_id: Union[str, int],
-        description: Optional[str] = "Payment order",
-        customer_ip: Optional[str] = "127.0.0.1",
+        description: str = "Payment order",
+        customer_ip: str = "127.0.0.1",
         buyer: Optional[BuyerData] = None,
         products: Optional[List[ProductData]] = None,
         shopping_carts: Optional[List[ShoppingCart]] = None,
         notify_url: Optional[str] = None,
         continue_url: Optional[str] = None,
+        with_response: bool = False,
         **kwargs,
     ) -> PaymentResponse:
         """
@@ -173,6 +453,7 @@ class Client:
         :param shopping_carts: List of carts in marketplace (only if is_marketplace set as True)
         :param notify_url: Callback url
         :param continue_url: Continue url (after successful payment)
+        :param with_response: Return ``(response, data)`` instead of ``data``
         :param kwargs: Additional params that will first be consumed by headers, with leftovers passed on to order request
         :return: JSON response from API
         """
@@ -180,37 +461,42 @@ class Client:
             assert (
                 shopping_carts
             ), "You must provide `shopping_carts` if marketplace used."
-        url = urljoin(self.api_url, "/api/v2_1/orders")
-        raw_data = {
+        url = f"{self._api_v21}/orders"
+        data: OrderData = {
             "extOrderId": order_id,
             "customerIp": customer_ip,
             "merchantPosId": self.pos_id,
             "description": description,
             "currencyCode": currency,
-            "totalAmount": amount,
+            "totalAmount": _to_cents(amount),
         }
         if notify_url:
-            raw_data["notifyUrl"] = notify_url
+            data["notifyUrl"] = notify_url
         if continue_url:
-            raw_data["continueUrl"] = continue_url
+            data["continueUrl"] = continue_url
         if buyer:
-            raw_data["buyer"] = buyer
+            data["buyer"] = buyer
         if shopping_carts:
-            raw_data["shoppingCarts"] = shopping_carts
+            data["shoppingCarts"] = self._centify_shopping_carts(shopping_carts)
+        elif products:
+            data["products"] = self._centify_products(products)
         else:
-            raw_data["products"] = products
-
-        data = self._centify(raw_data)
-        headers = self._headers(**kwargs)
-        data.update(kwargs)
-        encoded = json.dumps(data, cls=DjangoJSONEncoder)
-        self.last_response = requests.post(
-            url, headers=headers, data=encoded, allow_redirects=False
+            data["products"] = products
+
+        encoded = orjson.dumps({**data, **kwargs}, default=_json_default)
+        response = self._retry_on_401(
+            self._session.post,
+            url,
+            headers=kwargs,
+            data=encoded,
+            allow_redirects=False,
         )
-        if self.last_response.status_code in [200, 201, 302]:
-            return self._normalize(self.last_response.json())
-        raise LockFailure(
-            "Error creating order", context={"raw_response": self.last_response}
+        return self._handle(
+            response,
+            (200, 201, 302),
+            LockFailure,
+            "Error creating order",
+            with_response=with_response,
         )
 
     @ensure_auth
@@ -221,11 +507,12 @@ class Client:
         ext_customer_id: Optional[str] = None,
         amount: Optional[Union[Decimal, float]] = None,
         description: Optional[str] = None,
+        with_response: bool = False,
         **kwargs,
     ) -> RefundResponse:
-        url = urljoin(self.api_url, f"/api/v2_1/orders/{order_id}/refunds")
+        url = f"{self._api_v21}/orders/{order_id}/refunds"
 
-        data = {
+        data: RefundInfo = {
             "description": description if description else "Zwrot",
             "extRefundId": ext_refund_id,
         }
@@ -234,56 +521,58 @@ class Client:
             data["extCustomerId"] = ext_customer_id
 
         if amount:
-            data["amount"] = amount
+            data["amount"] = _to_cents(amount)
 
-        payload = {"refund": self._centify(data)}
+        encoded = orjson.dumps({"refund": data}, default=_json_default)
 
-        self.last_response = requests.post(
-            url, headers=self._headers(**kwargs), json=payload,
+        response = self._retry_on_401(
+            self._session.post, url, headers=kwargs, data=encoded,
         )
-        if self.last_response.status_code == 200:
-            return self._normalize(self.last_response.json())
-        raise RefundFailure(
-            "Error creating refund", context={"raw_response": self.last_response}
+        return self._handle(
+            response,
+            (200,),
+            RefundFailure,
+            "Error creating refund",
+            with_response=with_response,
         )
 
     @ensure_auth
-    def cancel_order(self, order_id: str, **kwargs) -> CancellationResponse:
-        url = urljoin(self.api_url, f"/api/v2_1/orders/{order_id}")
-        self.last_response = requests.delete(url, headers=self._headers(**kwargs))
-        if self.last_response.status_code == 200:
-            return self._normalize(self.last_response.json())
-        raise GetPaidException(
-            "Error cancelling order", context={"raw_response": self.last_response}
+    def cancel_order(
+        self, order_id: str, with_response: bool = False, **kwargs
+    ) -> CancellationResponse:
+        url = f"{self._api_v21}/orders/{order_id}"
+        response = self._retry_on_401(self._session.delete, url, headers=kwargs)
+        return self._handle(
+            response,
+            (200,),
+            GetPaidException,
+            "Error cancelling order",
+            with_response=with_response,
         )
 
+    @cached_read
     @ensure_auth
     def submerchant_status(self, ext_customer_id, currency_code="PLN"):
-        url = urljoin(
-            self.api_url, f"/api/v2_1/customers/ext/{ext_customer_id}/status",
-        )
-        headers = self._headers()
-        self.last_response = requests.get(
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/status"
+        response = self._retry_on_401(
+            self._session.get,
             url,
-            headers=headers,
             allow_redirects=False,
             params={"currencyCode": currency_code},
         )
-        return self._normalize(self.last_response.json())
+        return response, self._parse(response)
 
+    @cached_read
     @ensure_auth
     def submerchant_balance(self, ext_customer_id, currency_code="PLN"):
-        url = urljoin(
-            self.api_url, f"/api/v2_1/customers/ext/{ext_customer_id}/balances",
-        )
-        headers = self._headers()
-        self.last_response = requests.get(
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/balances"
+        response = self._retry_on_401(
+            self._session.get,
             url,
-            headers=headers,
             allow_redirects=False,
             params={"currencyCode": currency_code},
         )
-        return self._normalize(self.last_response.json())
+        return response, self._parse(response)
 
     @ensure_auth
     def submerchant_operations(
@@ -311,9 +600,7 @@ class Client:
         :param currency_code: ISO-4217 currency code
         :param page: page number
         """
-        url = urljoin(
-            self.api_url, f"/api/v2_1/customers/ext/{ext_customer_id}/operations",
-        )
+        url = f"{self._api_v21}/customers/ext/{ext_customer_id}/operations"
         params = {
             "currencyCode": currency_code,
             "eventDateFrom": date_from.replace(microsecond=0).isoformat(),
@@ -324,35 +611,47 @@ class Client:
             "sortBy": order_by,
         }
 
-        url += "?" + urlencode({k: v for k, v in params.items() if v is not None})
-        headers = self._headers()
-        self.last_response = requests.get(url, headers=headers, allow_redirects=False)
-        return self._normalize(self.last_response.json())
+        response = self._retry_on_401(
+            self._session.get,
+            url,
+            allow_redirects=False,
+            params={k: v for k, v in params.items() if v is not None},
+        )
+        return self._parse(response)
 
     @ensure_auth
-    def capture(self, order_id: str, **kwargs) -> ChargeResponse:
-        url = urljoin(self.api_url, f"/api/v2_1/orders/{order_id}/status")
-        data = {"orderId": order_id, "orderStatus": OrderStatus.COMPLETED}
-        self.last_response = requests.put(url, headers=self._headers(**kwargs))
-        if self.last_response.status_code == 200:
-            return self._normalize(self.last_response.json())
-        raise ChargeFailure(
-            "Error charging locked payment",
-            context={"raw_response": self.last_response},
+    def capture(
+        self, order_id: str, with_response: bool = False, **kwargs
+    ) -> ChargeResponse:
+        url = f"{self._api_v21}/orders/{order_id}/status"
+        data: ChargeRequest = {
+            "orderId": order_id,
+            "orderStatus": OrderStatus.COMPLETED,
+        }
+        encoded = orjson.dumps(data)
+        response = self._retry_on_401(
+            self._session.put, url, headers=kwargs, data=encoded
+        )
+        return self._handle(
+            response, (200,), ChargeFailure, "Error charging locked payment",
+            with_response=with_response,
         )
 
     @ensure_auth
-    def get_order_info(self, order_id: str, **kwargs) -> RetrieveOrderInfoResponse:
-        url = urljoin(self.api_url, f"/api/v2_1/orders/{order_id}")
-        self.last_response = requests.get(url, headers=self._headers(**kwargs))
-        if self.last_response.status_code == 200:
-            return self._normalize(self.last_response.json())
-        raise CommunicationError(context={"raw_response": self.last_response})
+    def get_order_info(
+        self, order_id: str, with_response: bool = False, **kwargs
+    ) -> RetrieveOrderInfoResponse:
+        url = f"{self._api_v21}/orders/{order_id}"
+        response = self._retry_on_401(self._session.get, url, headers=kwargs)
+        return self._handle(
+            response, (200,), CommunicationError, with_response=with_response
+        )
 
     @ensure_auth
     def get_order_transactions(self, order_id: str, **kwargs):
         raise NotImplementedError
 
+    @cached_read
     @ensure_auth
     def get_shop_info(self, shop_id: str, **kwargs):
         """
@@ -362,12 +661,14 @@ class Client:
         :param kwargs:
         :return:
         """
-        url = urljoin(self.api_url, f"/api/v2_1/shops/{shop_id}")
-        self.last_response = requests.get(url, headers=self._headers(**kwargs))
-        if self.last_response.status_code == 200:
-            return self._normalize(self.last_response.json())
-        raise CommunicationError(
-            "Error getting shop info", context={"raw_response": self.last_response}
+        url = f"{self._api_v21}/shops/{shop_id}"
+        response = self._retry_on_401(self._session.get, url, headers=kwargs)
+        return self._handle(
+            response,
+            (200,),
+            CommunicationError,
+            "Error getting shop info",
+            with_response=True,
         )
 
     def get_paymethods(self, lang: Optional[str] = None):
@@ -383,6 +684,7 @@ class Client:
         ext_customer_id: str = None,
         currency_code: str = "PLN",
         ext_payout_id: str = None,
+        with_response: bool = False,
         **kwargs,
     ):
         """
@@ -397,13 +699,13 @@ class Client:
             assert ext_payout_id
             assert customer_name
 
-        data = {
+        data: PayoutRequest = {
             "shopId": shop_id,
             "payout": {"currencyCode": currency_code, "description": description},
         }
 
         if amount:
-            data["amount"] = amount
+            data["amount"] = _to_cents(amount)
 
         if ext_payout_id:
             data["payout"]["extPayoutId"] = ext_payout_id
@@ -414,15 +716,16 @@ class Client:
         if customer_name:
             data["customerAddress"] = {"name": customer_name}
 
-        payload = self._centify(data)
+        encoded = orjson.dumps(data, default=_json_default)
 
-        url = urljoin(self.api_url, f"/api/v2_1/payouts")
-        self.last_response = requests.post(
-            url, headers=self._headers(**kwargs), json=payload
+        url = f"{self._api_v21}/payouts"
+        response = self._retry_on_401(
+            self._session.post, url, headers=kwargs, data=encoded
         )
-        if self.last_response.status_code == 201:
-            return self._normalize(self.last_response.json())
-
-        raise PayoutFailure(
-            "Payout not available", context={"raw_response": self.last_response}
+        return self._handle(
+            response,
+            (201,),
+            PayoutFailure,
+            "Payout not available",
+            with_response=with_response,
         )
@@ -172,17 +172,19 @@ class PaymentProcessor(BaseProcessor):
     def prepare_lock(self, request=None, **kwargs):
         results = {}
         params = self.get_paywall_context(request=request, **kwargs)
-        response = self.client.new_order(**params)
-        results["raw_response"] = self.client.last_response
+        raw_response, response = self.client.new_order(with_response=True, **params)
+        results["raw_response"] = raw_response
         self.payment.confirm_prepared()
         self.payment.external_id = results["ext_order_id"] = response.get("orderId", "")
         self.payment.redirect_uri = results["url"] = response.get("redirectUri", "")
         return results
 
     def charge(self, **kwargs):
-        response = self.client.capture(self.payment.external_id)
+        raw_response, response = self.client.capture(
+            self.payment.external_id, with_response=True
+        )
         result = {
-            "raw_response": self.client.last_response,
+            "raw_response": raw_response,
             "status_desc": response.get("status", {}).get("statusDesc"),
         }
         if response.get("status", {}).get("statusCode") == ResponseStatus.SUCCESS:
@@ -215,8 +217,10 @@ class PaymentProcessor(BaseProcessor):
         return given_signature, expected_signature
 
     def fetch_payment_status(self) -> PaymentStatusResponse:
-        response = self.client.get_order_info(self.payment.external_id)
-        results = {"raw_response": self.client.last_response}
+        raw_response, response = self.client.get_order_info(
+            self.payment.external_id, with_response=True
+        )
+        results = {"raw_response": raw_response}
         order_data = response.get("orders", [None])[0]
 
         status = order_data.get("status")
@@ -186,6 +186,16 @@ class ProductData(TypedDict):
     listingDate: Optional[Union[str, datetime]]
 
 
+class BaseShoppingCartData(TypedDict):
+    extCustomerId: Union[str, int]
+    amount: int
+    products: List[ProductData]
+
+
+class ShoppingCartData(BaseShoppingCartData, total=False):
+    fee: int
+
+
 class RefundStatus(AutoName):
     PENDING = auto()
     FINALIZED = auto()
@@ -212,18 +222,23 @@ class OrderStatusObj(TypedDict):
     statusDesc: Optional[str]
 
 
-class OrderData(TypedDict):
+class BaseOrderData(TypedDict):
     extOrderId: Union[str, int]
-    notifyUrl: Optional[str]
     customerIp: str
     merchantPosId: Union[str, int]
     description: str
-    validityTime: Union[str, int]
     currencyCode: str
     totalAmount: Union[str, int]
+
+
+class OrderData(BaseOrderData, total=False):
+    notifyUrl: str
+    continueUrl: str
+    validityTime: Union[str, int]
     buyer: BuyerData
-    products: List[ProductData]
-    payMethods: Optional[PayMethods]
+    products: Optional[List[ProductData]]
+    shoppingCarts: List[ShoppingCartData]
+    payMethods: PayMethods
     status: OrderStatus
 
 
@@ -238,12 +253,17 @@ class OrderNotification(TypedDict):
     properties: Optional[List[SpecData]]
 
 
-class RefundInfo(TypedDict):  # request
+class BaseRefundInfo(TypedDict):  # request
+    description: str
+
+
+class RefundInfo(BaseRefundInfo, total=False):
     refundId: Union[str, int]
-    amount: Optional[Union[str, int]]
-    extRefundId: Optional[Union[str, int]]
-    bankDescription: Optional[str]
-    type: Optional[Literal["REFUND_PAYMENT_STANDARD"]]
+    amount: Union[str, int]
+    extRefundId: Union[str, int]
+    extCustomerId: Union[str, int]
+    bankDescription: str
+    type: Literal["REFUND_PAYMENT_STANDARD"]
 
 
 class RefundRequest(TypedDict):
@@ -282,6 +302,34 @@ class PaymentResponse(BaseResponse):
     redirectUri: str
 
 
+class BasePayoutInfo(TypedDict):
+    currencyCode: str
+    description: str
+
+
+class PayoutInfo(BasePayoutInfo, total=False):
+    extPayoutId: Union[str, int]
+
+
+class PayoutAccount(TypedDict):
+    extCustomerId: Union[str, int]
+
+
+class PayoutCustomerAddress(TypedDict):
+    name: str
+
+
+class BasePayoutRequest(TypedDict):
+    shopId: str
+    payout: PayoutInfo
+
+
+class PayoutRequest(BasePayoutRequest, total=False):
+    amount: int
+    account: PayoutAccount
+    customerAddress: PayoutCustomerAddress
+
+
 class ChargeRequest(TypedDict):
     orderId: Union[str, int]
     orderStatus: Literal[OrderStatus.COMPLETED]
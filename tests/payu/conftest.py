@@ -1,13 +1,23 @@
 import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 
-from getpaid.backends.payu.client import Client
+from getpaid.backends.payu.client import Client, _read_cache
 
 from .factories import PaymentFactory
 
 register(PaymentFactory)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    _read_cache.clear()
+    yield
+    cache.clear()
+    _read_cache.clear()
+
+
 @pytest.fixture
 def oauth_mocked(requests_mock):
     requests_mock.post(
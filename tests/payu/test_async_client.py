@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pytest import raises
+
+from getpaid.exceptions import CommunicationError
+
+httpx = pytest.importorskip("httpx")
+
+from getpaid.backends.payu.async_client import AsyncClient  # noqa: E402
+
+EXT_ID = "test123"
+MISSING_ID = "missing"
+NOT_FOUND = {"status": {"statusCode": "DATA_NOT_FOUND"}}
+
+RESPONSES = {
+    "/pl/standard/user/oauth/authorize": {
+        "access_token": "7524f96e-2d22-45da-bc64-778a61cbfc26",
+        "token_type": "bearer",
+        "expires_in": 43199,
+        "grant_type": "client_credentials",
+    },
+    f"/api/v2_1/customers/ext/{EXT_ID}/status": {
+        "customerVerificationStatus": "Verified",
+    },
+    f"/api/v2_1/customers/ext/{EXT_ID}/balances": {
+        "balance": {"availableAmount": "5494", "totalAmount": "5500"},
+        "status": {"statusCode": "SUCCESS"},
+    },
+}
+
+
+@pytest.fixture
+def requests_log(monkeypatch):
+    log = []
+
+    async def handler(request):
+        log.append(request)
+        await asyncio.sleep(0)  # let other gathered calls run meanwhile
+        if request.url.path in RESPONSES:
+            return httpx.Response(200, json=RESPONSES[request.url.path])
+        if f"/customers/ext/{MISSING_ID}/" in request.url.path:
+            return httpx.Response(404, json=NOT_FOUND)
+        return httpx.Response(500, text="FAILURE")
+
+    monkeypatch.setattr(
+        AsyncClient,
+        "_create_http_client",
+        staticmethod(
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ),
+    )
+    return log
+
+
+def _client():
+    return AsyncClient(
+        api_url="https://example.com/",
+        pos_id=300746,
+        second_key="b6ca15b0d1020e8094d9b5f8d163db54",
+        oauth_id=300746,
+        oauth_secret="2ee86a66e5d97e3fadc400c9f19b065d",
+    )
+
+
+def _run(coro):
+    # asyncio.run() is not available on Python 3.6
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_concurrent_calls(requests_log):
+    async def fetch():
+        async with _client() as client:
+            return await asyncio.gather(
+                client.submerchant_status(EXT_ID), client.submerchant_balance(EXT_ID)
+            )
+
+    status, balance = _run(fetch())
+    assert status["customerVerificationStatus"] == "Verified"
+    assert balance["balance"]["availableAmount"] == Decimal("54.94")
+    assert requests_log[-1].headers["Authorization"].startswith("Bearer ")
+    assert requests_log[-1].url.params["currencyCode"] == "PLN"
+
+
+def test_concurrent_calls_authorize_once(requests_log):
+    async def fetch():
+        async with _client() as client:
+            return await asyncio.gather(
+                client.submerchant_status(EXT_ID),
+                client.submerchant_balance(EXT_ID),
+                client.submerchant_status(EXT_ID, currency_code="EUR"),
+            )
+
+    _run(fetch())
+    oauth_calls = [r for r in requests_log if r.url.path.endswith("/authorize")]
+    assert len(oauth_calls) == 1
+    assert len(requests_log) == 4
+
+
+def test_get_shop_info_failure(requests_log):
+    async def fetch():
+        async with _client() as client:
+            return await client.get_shop_info(shop_id="shop")
+
+    with raises(CommunicationError):
+        _run(fetch())
+
+
+def test_submerchant_reads_return_error_body(requests_log):
+    async def fetch():
+        async with _client() as client:
+            return await asyncio.gather(
+                client.submerchant_status(MISSING_ID),
+                client.submerchant_balance(MISSING_ID),
+                client.submerchant_operations(
+                    MISSING_ID, datetime(2020, 1, 1), datetime(2020, 1, 31)
+                ),
+            )
+
+    assert _run(fetch()) == [NOT_FOUND] * 3
@@ -6,6 +6,7 @@ import swapper
 from django.urls import reverse_lazy
 from pytest import raises
 
+from getpaid.backends.payu.client import Client
 from getpaid.backends.payu.types import Currency
 from getpaid.exceptions import (
     ChargeFailure,
@@ -29,6 +30,7 @@ url_api_operate = reverse_lazy("paywall:api_operate")
     [
         ({"unitPrice": 100}, {"unitPrice": Decimal("1")}),
         ({"amount": 100}, {"amount": Decimal("1")}),
+        ({"amount": "5494"}, {"amount": Decimal("54.94")}),
         ([{"amount": 100}], [{"amount": Decimal("1")}]),
         ({"internal": {"amount": 100}}, {"internal": {"amount": Decimal("1")}}),
         ({"internal": [{"amount": 100}]}, {"internal": [{"amount": Decimal("1")}]}),
@@ -50,6 +52,7 @@ def test_normalize(before, after, getpaid_client):
         ({"amount": 1}, {"amount": 100}),
         ({"unitPrice": 1.0}, {"unitPrice": 100}),
         ({"unitPrice": Decimal("1")}, {"unitPrice": 100}),
+        ({"unitPrice": Decimal("1.999")}, {"unitPrice": 200}),
         ([{"unitPrice": Decimal("1")}], [{"unitPrice": 100}]),
         ({"internal": {"unitPrice": Decimal("1")}}, {"internal": {"unitPrice": 100}}),
         (
@@ -67,6 +70,16 @@ def test_centify(before, after, getpaid_client):
     assert result == after
 
 
+@pytest.mark.parametrize("method", ["_centify", "_normalize"])
+def test_conversion_keeps_input_intact(method, getpaid_client):
+    data = {"internal": [{"amount": Decimal("1")}], "other": {"fee": 1}}
+    result = getattr(getpaid_client, method)(data)
+    assert data == {"internal": [{"amount": Decimal("1")}], "other": {"fee": 1}}
+    assert result["internal"] is not data["internal"]
+    assert result["internal"][0] is not data["internal"][0]
+    assert result["other"] is not data["other"]
+
+
 @pytest.mark.parametrize("response_status", [200, 201, 302])
 def test_new_order(response_status, getpaid_client, requests_mock):
     my_order_id = f"{uuid.uuid4()}"
@@ -122,6 +135,34 @@ def test_capture_failure(response_status, getpaid_client, requests_mock):
         getpaid_client.capture(order_id=ext_order_id)
 
 
+def test_capture(getpaid_client, requests_mock):
+    ext_order_id = "WZHF5FFDRJ140731GUEST000P01"
+    requests_mock.put(
+        f"/api/v2_1/orders/{ext_order_id}/status",
+        json={"status": {"statusCode": "SUCCESS"}},
+    )
+    result = getpaid_client.capture(order_id=ext_order_id)
+    assert result["status"]["statusCode"] == "SUCCESS"
+    assert requests_mock.last_request.json() == {
+        "orderId": ext_order_id,
+        "orderStatus": "COMPLETED",
+    }
+
+
+def test_get_order_info_with_response(getpaid_client, requests_mock):
+    ext_order_id = "WZHF5FFDRJ140731GUEST000P01"
+    body = {"orders": [{"totalAmount": "12345"}], "status": {"statusCode": "SUCCESS"}}
+    requests_mock.get(f"/api/v2_1/orders/{ext_order_id}", json=body)
+
+    response, result = getpaid_client.get_order_info(
+        order_id=ext_order_id, with_response=True
+    )
+    assert response.status_code == 200
+    assert response.json() == body
+    assert result["orders"][0]["totalAmount"] == Decimal("123.45")
+    assert getpaid_client.last_response is None
+
+
 @pytest.mark.parametrize("response_status", [400, 401, 403, 500, 501])
 def test_get_order_info_failure(response_status, getpaid_client, requests_mock):
     ext_order_id = "WZHF5FFDRJ140731GUEST000P01"
@@ -141,3 +182,116 @@ def test_get_shop_info_failure(response_status, getpaid_client, requests_mock):
     )
     with raises(CommunicationError):
         getpaid_client.get_shop_info(shop_id=getpaid_client.pos_id)
+
+
+def test_token_shared_between_clients(getpaid_client, requests_mock):
+    Client(
+        api_url=getpaid_client.api_url,
+        oauth_id=getpaid_client.oauth_id,
+        oauth_secret=getpaid_client.oauth_secret,
+    )
+    oauth_calls = [
+        r for r in requests_mock.request_history if r.path.endswith("/authorize")
+    ]
+    assert len(oauth_calls) == 1
+
+
+def test_session_shared_between_clients(getpaid_client):
+    other = Client(
+        api_url=getpaid_client.api_url,
+        oauth_id=getpaid_client.oauth_id,
+        oauth_secret=getpaid_client.oauth_secret,
+    )
+    assert other._session is getpaid_client._session
+    assert "Authorization" not in getpaid_client._session.headers
+
+
+def test_reauthorize_on_401(getpaid_client, requests_mock):
+    ext_order_id = "WZHF5FFDRJ140731GUEST000P01"
+    requests_mock.get(
+        f"/api/v2_1/orders/{ext_order_id}",
+        [
+            {"text": "UNAUTHORIZED", "status_code": 401},
+            {"json": {"orders": [], "status": {"statusCode": "SUCCESS"}}},
+        ],
+    )
+    result = getpaid_client.get_order_info(order_id=ext_order_id)
+    assert result["status"]["statusCode"] == "SUCCESS"
+    oauth_calls = [
+        r for r in requests_mock.request_history if r.path.endswith("/authorize")
+    ]
+    assert len(oauth_calls) == 2
+
+
+def test_new_order_payload(getpaid_client, requests_mock):
+    requests_mock.post("/api/v2_1/orders", json={}, status_code=201)
+    getpaid_client.new_order(
+        amount=Decimal("12.34"),
+        currency=Currency.PLN,
+        order_id="order-1",
+        products=[
+            {"name": "Product", "unitPrice": Decimal("12.34"), "quantity": Decimal(1)}
+        ],
+    )
+    assert requests_mock.last_request.headers["Authorization"] == getpaid_client.token
+    payload = requests_mock.last_request.json()
+    assert payload["totalAmount"] == 1234
+    assert payload["currencyCode"] == "PLN"
+    assert payload["products"] == [
+        {"name": "Product", "unitPrice": 1234, "quantity": "1"}
+    ]
+
+
+def test_centify_shopping_carts(getpaid_client):
+    carts = [
+        {
+            "extCustomerId": "seller",
+            "amount": Decimal("10.50"),
+            "fee": Decimal("0.50"),
+            "products": [{"name": "Product", "unitPrice": Decimal("5.25")}],
+        }
+    ]
+    result = getpaid_client._centify_shopping_carts(carts)
+    assert result == [
+        {
+            "extCustomerId": "seller",
+            "amount": 1050,
+            "fee": 50,
+            "products": [{"name": "Product", "unitPrice": 525}],
+        }
+    ]
+    assert carts[0]["amount"] == Decimal("10.50")
+    assert carts[0]["products"][0]["unitPrice"] == Decimal("5.25")
+
+
+def test_client_params_follow_settings(settings, oauth_mocked):
+    slug = settings.GETPAID_PAYU_SLUG
+    assert Client().pos_id == settings.GETPAID_BACKEND_SETTINGS[slug]["pos_id"]
+    settings.GETPAID_BACKEND_SETTINGS = {
+        **settings.GETPAID_BACKEND_SETTINGS,
+        slug: {**settings.GETPAID_BACKEND_SETTINGS[slug], "pos_id": 123},
+    }
+    assert Client().pos_id == 123
+
+
+def test_reauthorize_expired_token(getpaid_client, requests_mock):
+    requests_mock.get(f"/api/v2_1/shops/{getpaid_client.pos_id}", json={})
+    getpaid_client.token_expiration = 0
+    getpaid_client.get_shop_info(shop_id=getpaid_client.pos_id)
+    oauth_calls = [
+        r for r in requests_mock.request_history if r.path.endswith("/authorize")
+    ]
+    assert len(oauth_calls) == 2
+
+
+def test_last_response_kept_only_on_failure(getpaid_client, requests_mock):
+    ext_order_id = "WZHF5FFDRJ140731GUEST000P01"
+    url = f"/api/v2_1/orders/{ext_order_id}"
+    requests_mock.get(url, json={})
+    getpaid_client.get_order_info(order_id=ext_order_id)
+    assert getpaid_client.last_response is None
+
+    requests_mock.get(url, text="FAILURE", status_code=500)
+    with raises(CommunicationError):
+        getpaid_client.get_order_info(order_id=ext_order_id)
+    assert getpaid_client.last_response.status_code == 500
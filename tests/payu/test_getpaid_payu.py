@@ -138,6 +138,25 @@ def test_pull_flow(
         assert can_proceed(callback_meth)
 
 
+def test_fetch_status_keeps_raw_response(
+    payment_factory, settings, requests_mock, getpaid_client
+):
+    settings.GETPAID_BACKEND_SETTINGS = _prep_conf(confirm_method=cm.PULL)
+
+    payment = payment_factory(external_id=uuid.uuid4())
+    payment.confirm_prepared()
+    body = {
+        "orders": [{"totalAmount": "12345", "status": OrderStatus.COMPLETED}],
+        "status": {"statusCode": "SUCCESS"},
+    }
+    requests_mock.get(f"/api/v2_1/orders/{payment.external_id}", json=body)
+
+    result = payment.fetch_status()
+    assert result["raw_response"].status_code == 200
+    assert result["raw_response"].json() == body
+    assert result["callback"] == "confirm_payment"
+
+
 @pytest.fixture
 def marketplace_get_items_mock(monkeypatch):
     items = [
@@ -126,3 +126,82 @@ def test_submerchant_operations(getpaid_client, requests_mock):
     assert operations[0]["status"] == "COMPLETED"
     product = operations[0]["details"]["counterparties"][0]["products"][0]
     assert product["unitPrice"] == Decimal("15.00")
+
+
+def test_submerchant_status_cached(getpaid_client, requests_mock):
+    ext_id = "test123"
+    url = urljoin(
+        getpaid_client.api_url,
+        f"/api/v2_1/customers/ext/{ext_id}/status?currencyCode=PLN",
+    )
+    mock = requests_mock.get(url, json={"customerVerificationStatus": "Verified"})
+    getpaid_client.submerchant_status(ext_customer_id=ext_id)
+    getpaid_client.submerchant_status(ext_customer_id=ext_id)
+    assert mock.call_count == 1
+    getpaid_client.submerchant_status(ext_customer_id=ext_id, no_cache=True)
+    assert mock.call_count == 2
+
+
+def test_submerchant_status_error_not_cached(getpaid_client, requests_mock):
+    ext_id = "test123"
+    url = urljoin(
+        getpaid_client.api_url,
+        f"/api/v2_1/customers/ext/{ext_id}/status?currencyCode=PLN",
+    )
+    mock = requests_mock.get(
+        url,
+        [
+            {"json": {"status": {"statusCode": "ERROR_INTERNAL"}}, "status_code": 500},
+            {"json": {"customerVerificationStatus": "Verified"}},
+        ],
+    )
+    status = getpaid_client.submerchant_status(ext_customer_id=ext_id)
+    assert status["status"]["statusCode"] == "ERROR_INTERNAL"
+    status = getpaid_client.submerchant_status(ext_customer_id=ext_id)
+    assert status["customerVerificationStatus"] == "Verified"
+    assert mock.call_count == 2
+
+
+def test_submerchant_status_cache_key(getpaid_client, requests_mock):
+    ext_id = "test123"
+    url = urljoin(
+        getpaid_client.api_url,
+        f"/api/v2_1/customers/ext/{ext_id}/status?currencyCode=PLN",
+    )
+    mock = requests_mock.get(url, json={"customerVerificationStatus": "Verified"})
+    getpaid_client.submerchant_status(ext_id)
+    getpaid_client.submerchant_status(ext_customer_id=ext_id)
+    getpaid_client.submerchant_status(ext_id, "PLN")
+    assert mock.call_count == 1
+
+
+def test_submerchant_balance_cached_copy(getpaid_client, requests_mock):
+    ext_id = "test123"
+    url = urljoin(
+        getpaid_client.api_url,
+        f"/api/v2_1/customers/ext/{ext_id}/balances?currencyCode=PLN",
+    )
+    mock = requests_mock.get(url, json={"balance": {"availableAmount": "5494"}})
+    first = getpaid_client.submerchant_balance(ext_customer_id=ext_id)
+    first["balance"]["availableAmount"] = Decimal(0)
+    second = getpaid_client.submerchant_balance(ext_customer_id=ext_id)
+    second["x"] = 1
+    third = getpaid_client.submerchant_balance(ext_customer_id=ext_id)
+    assert third == {"balance": {"availableAmount": Decimal("54.94")}}
+    assert mock.call_count == 1
+
+
+def test_submerchant_operations_error_body(getpaid_client, requests_mock):
+    ext_id = "missing"
+    body = {"status": {"statusCode": "DATA_NOT_FOUND"}}
+    requests_mock.get(
+        urljoin(getpaid_client.api_url, f"/api/v2_1/customers/ext/{ext_id}/operations"),
+        json=body,
+        status_code=404,
+    )
+    operations = getpaid_client.submerchant_operations(
+        ext_customer_id=ext_id,
+        date_from=datetime(2020, 1, 1),
+        date_to=datetime(2020, 1, 31),
+    )
+    assert operations == body